@@ -0,0 +1,97 @@
+"""
+Helpers shared by the server test modules.
+"""
+
+import asyncio
+import os
+import subprocess
+from functools import singledispatch
+from typing import Any
+
+# Sentinel for attribute lookups, so a missing attribute costs one getattr() call
+_MISSING = object()
+
+
+@singledispatch
+def extract_text_content(response: Any) -> str:
+    """Extract text from TextContent objects or convert response to string.
+
+    Args:
+        response: The response object, which could be a TextContent object,
+                 a list of TextContent objects, a string, or other type
+
+    Returns:
+        The extracted text as a string
+    """
+    # Single TextContent object; anything else (including None) is converted to a string
+    text = getattr(response, "text", _MISSING)
+    return text if text is not _MISSING else str(response)
+
+
+@extract_text_content.register(list)
+@extract_text_content.register(tuple)
+def _(response) -> str:
+    # Most common case: the MCP client returns a list of TextContent objects.
+    # Only the first item is checked; MCP content lists are homogeneous.
+    if response:
+        text = getattr(response[0], "text", _MISSING)
+        if text is not _MISSING:
+            return text
+    return str(response)
+
+
+@extract_text_content.register
+def _(response: str) -> str:
+    return response
+
+
+@extract_text_content.register
+def _(response: dict) -> str:
+    return response["text"] if "text" in response else str(response)
+
+
+async def await_exit(process: subprocess.Popen, timeout: float = 2.0) -> bool:
+    """Wait until a subprocess.Popen has exited.
+
+    Runs the blocking Popen.wait() in an executor, so this returns as soon as
+    the process is gone instead of sleeping for a fixed time.
+
+    Args:
+        process: The process to wait for
+        timeout: Maximum number of seconds to wait
+
+    Returns:
+        True if the process exited, False if it was still running at the deadline
+    """
+    if process.poll() is not None:
+        return True
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, process.wait, timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    return True
+
+
+def pid_exited(pid: int) -> bool:
+    """Check whether a process has exited, reaping it if it is our child.
+
+    A signal-0 probe reports an exited but unreaped child (a zombie) as alive;
+    os.waitpid() both checks and reaps our own children. Only use this for
+    processes no subprocess.Popen owns, or that Popen would otherwise reap.
+
+    Args:
+        pid: PID of the process to check
+
+    Returns:
+        True if the process is gone, False if it is still running
+    """
+    try:
+        reaped_pid, _ = os.waitpid(pid, os.WNOHANG)
+        return reaped_pid != 0
+    except ChildProcessError:
+        # Not our child (or already reaped), so fall back to probing with signal 0
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return True
+        return False
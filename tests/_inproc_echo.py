@@ -0,0 +1,57 @@
+"""
+In-process version of the multi-transport echo server, for tests.
+
+The server exposes the same tools as examples/multi_transport_echo.py, but runs
+inside the test process over FastMCP's in-memory transport, so tests that only
+exercise the echo tools don't pay for spawning a Python interpreter.
+"""
+
+from fastmcp import Client, FastMCP, Context
+
+from mcp_client_multi_server import MultiServerClient
+
+
+def create_echo_server(name: str = "echo-inproc-server", prefix: str = "INPROC: ") -> FastMCP:
+    """Create an echo server with the same tools as multi_transport_echo.py.
+
+    Args:
+        name: Server name reported by get_server_info
+        prefix: Prefix process_message adds to each message
+
+    Returns:
+        The FastMCP server instance
+    """
+    mcp = FastMCP(name)
+
+    @mcp.tool()
+    async def process_message(message: str, ctx: Context) -> str:
+        """Process a user message and echo it back."""
+        await ctx.info(f"Received message: {message}")
+        return f"{prefix}{message}"
+
+    @mcp.tool()
+    async def ping() -> str:
+        """Simple ping tool for testing connectivity."""
+        return "pong"
+
+    @mcp.tool()
+    async def get_server_info() -> dict:
+        """Get server information."""
+        return {"name": name, "transport": "inprocess"}
+
+    return mcp
+
+
+def register_in_process_server(client: MultiServerClient, server_name: str, server: FastMCP) -> None:
+    """Make ``server_name`` on ``client`` talk to ``server`` in-process.
+
+    MultiServerClient.connect() reuses any client it already holds for a name, so
+    seeding that cache routes query_server() and list_server_tools() to the
+    in-memory server without needing a config entry or a launch.
+
+    Args:
+        client: The MultiServerClient to register the server with
+        server_name: Name tests use to address the server
+        server: The FastMCP server instance to connect to
+    """
+    client._clients[server_name] = Client(server)
@@ -4,14 +4,33 @@ Configuration for pytest.
 
 import os
 import sys
+import copy
 import json
+import shutil
 import pytest
 import logging
 from pathlib import Path
 
+# uvloop is optional and not available on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Path to the example config shared by most of the test suite
+EXAMPLE_CONFIG_PATH = Path(__file__).parent.parent / "examples" / "config.json"
+
+
+if uvloop is not None and sys.platform != "win32":
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the async tests on uvloop when it's installed, for a faster event loop."""
+        return uvloop.EventLoopPolicy()
+
+
 # Configure logging
 @pytest.fixture(scope="session", autouse=True)
 def configure_logging():
@@ -27,4 +46,62 @@ def configure_logging():
 
     return logger
 
+
+def _fetch_uvx_available() -> bool:
+    """Check for uvx the way test_fetch_server.py does: MCP_UVX_PATH, the configured path, then PATH."""
+    override = os.environ.get("MCP_UVX_PATH")
+    if override and os.path.exists(override):
+        return True
+    try:
+        config = json.loads(EXAMPLE_CONFIG_PATH.read_text())
+        command = config["mcpServers"]["fetch"]["command"]
+    except (OSError, ValueError, KeyError):
+        command = ""
+    return bool(command and os.path.exists(command)) or shutil.which("uvx") is not None
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the fetch server tests at collection time when they can't run.
+
+    Skipping here means none of their fixtures (client, fetch_warm, ...) are set up.
+    Set MCP_SKIP_FETCH=1 to skip them even when uvx is installed.
+    """
+    fetch_items = [item for item in items if item.path.name == "test_fetch_server.py"]
+    if not fetch_items:
+        return
+
+    if os.environ.get("MCP_SKIP_FETCH") == "1":
+        reason = "MCP_SKIP_FETCH=1 is set"
+    elif not _fetch_uvx_available():
+        reason = "uvx not available, skipping fetch server tests"
+    else:
+        return
+
+    skip_fetch = pytest.mark.skip(reason=reason)
+    for item in fetch_items:
+        item.add_marker(skip_fetch)
+
+
+@pytest.fixture(scope="session")
+def config_path():
+    """Provide the path to the example config file, checking that it exists once per session."""
+    assert EXAMPLE_CONFIG_PATH.exists(), f"Example config not found at {EXAMPLE_CONFIG_PATH}"
+    return str(EXAMPLE_CONFIG_PATH)
+
+
+@pytest.fixture(scope="session")
+def raw_config():
+    """Parse the example config once per test session.
+
+    Treat the result as read-only; use ``client_config`` for a copy that a test
+    (or the client it builds) is free to modify.
+    """
+    return json.loads(EXAMPLE_CONFIG_PATH.read_text())
+
+
+@pytest.fixture
+def client_config(raw_config):
+    """Provide a private copy of the example config for MultiServerClient(custom_config=...)."""
+    return copy.deepcopy(raw_config)
+
 # We now have the proper config in the config.json file
\ No newline at end of file
@@ -16,15 +16,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from mcp_client_multi_server.client import MultiServerClient
 
 
-# Path to the example config file
-EXAMPLE_CONFIG_PATH = Path(__file__).parent.parent / "examples" / "config.json"
-
-
-@pytest.fixture
-def config_path():
-    """Provide the path to the example config file."""
-    assert EXAMPLE_CONFIG_PATH.exists(), f"Example config not found at {EXAMPLE_CONFIG_PATH}"
-    return str(EXAMPLE_CONFIG_PATH)
+# The Playwright server always binds port 3001, so its tests are opt-in. Skipping via a
+# marker happens at collection time, before the client fixture is ever built.
+requires_playwright = pytest.mark.skipif(
+    os.environ.get("MCP_TEST_PLAYWRIGHT") != "1",
+    reason="Playwright server needs port 3001; set MCP_TEST_PLAYWRIGHT=1 to run these tests"
+)
 
 
 @pytest.fixture
@@ -44,9 +41,9 @@ def logger():
 
 
 @pytest.fixture
-async def client(config_path, logger):
+async def client(config_path, client_config, logger):
     """Create a client for server tests."""
-    client = MultiServerClient(config_path=config_path, logger=logger)
+    client = MultiServerClient(config_path=config_path, custom_config=client_config, logger=logger)
     yield client
     # Clean up
     await client.close()
@@ -288,6 +285,7 @@ async def test_sequential_thinking_server_launch_stop(client):
 
 # Playwright Server Tests
 
+@requires_playwright
 @pytest.mark.asyncio
 async def test_playwright_server_connection(client):
     """Test connecting to the playwright server.
@@ -377,6 +375,7 @@ async def test_playwright_server_connection(client):
         pytest.fail(f"Failed to connect to Playwright server: {e}")
 
 
+@requires_playwright
 @pytest.mark.asyncio
 async def test_playwright_server_tools(client):
     """Test listing tools on the playwright server."""
@@ -459,6 +458,7 @@ async def test_playwright_server_tools(client):
         pytest.fail(f"Failed to list tools from Playwright server: {e}")
 
 
+@requires_playwright
 @pytest.mark.asyncio
 async def test_playwright_tool_exec(client):
     """Test executing a tool on the playwright server."""
@@ -4,30 +4,66 @@ This test file verifies real communication with servers using all supported tran
 """
 
 import os
+import copy
 import asyncio
+import subprocess
 import pytest
+import pytest_asyncio
 from pathlib import Path
 
 from mcp_client_multi_server.client import MultiServerClient
 
+# Port used by the streamable HTTP echo server. Override it (e.g. per pytest-xdist
+# worker or per CI job) so concurrent sessions don't fight over the same port.
+DEFAULT_ECHO_HTTP_PORT = 8767
+ECHO_HTTP_PORT = int(os.environ.get("MCP_TEST_ECHO_HTTP_PORT", DEFAULT_ECHO_HTTP_PORT))
 
+# The STDIO echo server, under a name of its own per pytest-xdist worker: launched
+# servers are recorded by name in a registry shared by every worker, and a STDIO
+# server has no port to keep workers apart.
+ECHO_STDIO = f"echo-stdio-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
+
+
+def _config_with_http_port(raw_config: dict, port: int) -> dict:
+    """Copy the example config, pointing the HTTP echo server and client at ``port``.
+
+    The copy also has the STDIO echo server under its per-worker name.
+    """
+    config = copy.deepcopy(raw_config)
+
+    servers = config["mcpServers"]
+    servers[ECHO_STDIO] = servers["echo-stdio"]
+    args = servers["echo-http-server"]["args"]
+    args[args.index("--port") + 1] = str(port)
+    servers["echo-http-client"]["url"] = servers["echo-http-client"]["url"].replace(
+        f":{DEFAULT_ECHO_HTTP_PORT}/", f":{port}/"
+    )
+    return config
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestMultiTransportEcho:
     """Integration tests for all transport types using real servers and clients."""
     
-    @pytest.fixture
-    async def client(self):
-        """Create MultiServerClient instance with the test config."""
+    @pytest_asyncio.fixture(scope="class", loop_scope="class")
+    @classmethod
+    async def client(cls, raw_config):
+        """Create one MultiServerClient instance shared by every test in the class."""
         # Get the absolute path to the example config
         config_path = Path(__file__).parent.parent / "examples" / "config.json"
         
         # Create the client
-        client = MultiServerClient(config_path=config_path, auto_launch=True)
+        config = _config_with_http_port(raw_config, ECHO_HTTP_PORT)
+        client = MultiServerClient(config_path=config_path, custom_config=config, auto_launch=True)
         
-        # Yield the client for tests to use
+        # Yield the client for tests to use; each test stops its own servers
         yield client
         
-        # Clean up after tests by stopping all servers
-        await client.stop_all_servers()
+        # Clean up anything a test left behind once the whole class is done. Only
+        # stop the servers this client launched: stop_all_servers() would also stop
+        # every server in the shared registry, including other workers' servers.
+        for server_name in list(client._local_processes):
+            await client.stop_server(server_name)
     
     def _assert_response_matches(self, response, expected_text):
         """Helper method to assert response content regardless of format."""
@@ -56,28 +92,27 @@ class TestMultiTransportEcho:
             print(f"Object dir: {dir(response)}")
             assert expected_text in str(response)
     
-    @pytest.mark.asyncio
     async def test_stdio_transport(self, client):
         """Test STDIO transport with the echo server."""
         # Launch the server
-        await client.launch_server("echo-stdio")
+        await client.launch_server(ECHO_STDIO)
         await asyncio.sleep(1)  # Give it time to start
         
         try:
             # Connect to the echo server
-            echo_client = await client.connect("echo-stdio")
+            echo_client = await client.connect(ECHO_STDIO)
             assert echo_client is not None
             
             # Send a message and verify response
-            response = await client.query_server("echo-stdio", "Hello from STDIO test")
+            response = await client.query_server(ECHO_STDIO, "Hello from STDIO test")
             self._assert_response_matches(response, "STDIO: Hello from STDIO test")
             
             # Test the ping tool
-            ping_response = await client.query_server("echo-stdio", tool_name="ping")
+            ping_response = await client.query_server(ECHO_STDIO, tool_name="ping")
             self._assert_response_matches(ping_response, "pong")
             
             # Get server info
-            info_response = await client.query_server("echo-stdio", tool_name="get_server_info")
+            info_response = await client.query_server(ECHO_STDIO, tool_name="get_server_info")
             # Display the response for debugging
             print(f"Server info response: {info_response}")
 
@@ -100,10 +135,10 @@ class TestMultiTransportEcho:
                 assert "stdio" in info_str
         finally:
             # Clean up
-            await client.stop_server("echo-stdio")
+            await client.stop_server(ECHO_STDIO)
     
     @pytest.mark.skip(reason="SSE transport not working reliably in test environment")
-    @pytest.mark.asyncio
+    @pytest.mark.xdist_group("echo-sse")
     async def test_sse_transport(self, client):
         """Test SSE transport with the echo server."""
         # First launch the SSE server
@@ -155,7 +190,7 @@ class TestMultiTransportEcho:
             # Clean up
             await client.stop_server("echo-sse-server")
     
-    @pytest.mark.asyncio
+    @pytest.mark.xdist_group("echo-http")
     async def test_streamable_http_transport(self, client):
         """Test Streamable HTTP transport with the echo server."""
         # First launch the HTTP server
@@ -188,30 +223,30 @@ class TestMultiTransportEcho:
                 assert info["name"] == "echo-http-server"
                 assert info["transport"] == "streamable-http"
                 assert info["host"] == "localhost"
-                assert info["port"] == 8767
+                assert info["port"] == ECHO_HTTP_PORT
             elif isinstance(info_response, dict):
                 # If it's already a dict, use it directly
                 info = info_response
                 assert info["name"] == "echo-http-server"
                 assert info["transport"] == "streamable-http"
                 assert info["host"] == "localhost"
-                assert info["port"] == 8767
+                assert info["port"] == ECHO_HTTP_PORT
             else:
                 # If it's another format, just check the text contains expected values
                 info_str = str(info_response)
                 assert "echo-http-server" in info_str
                 assert "streamable-http" in info_str
                 assert "localhost" in info_str
-                assert "8767" in info_str
+                assert str(ECHO_HTTP_PORT) in info_str
         finally:
             # Clean up
             await client.stop_server("echo-http-server")
     
-    @pytest.mark.asyncio
+    @pytest.mark.xdist_group("echo-http")  # Shares the HTTP echo port with the test above
     async def test_multiple_transports_simultaneously(self, client):
         """Test connecting to multiple transport types simultaneously."""
         # Launch stdio and HTTP servers (skipping SSE since it had issues)
-        await client.launch_server("echo-stdio")
+        await client.launch_server(ECHO_STDIO)
         await client.launch_server("echo-http-server")
 
         # Give servers time to start
@@ -219,7 +254,7 @@ class TestMultiTransportEcho:
 
         try:
             # Connect to the clients
-            stdio_client = await client.connect("echo-stdio")
+            stdio_client = await client.connect(ECHO_STDIO)
             http_client = await client.connect("echo-http-client")
 
             # Check that all connections succeeded
@@ -228,7 +263,7 @@ class TestMultiTransportEcho:
 
             # Define tasks for concurrent querying
             async def stdio_task():
-                return await client.query_server("echo-stdio", "Hello from STDIO")
+                return await client.query_server(ECHO_STDIO, "Hello from STDIO")
 
             async def http_task():
                 return await client.query_server("echo-http-client", "Hello from HTTP")
@@ -243,24 +278,23 @@ class TestMultiTransportEcho:
             self._assert_response_matches(http_result, "HTTP: Hello from HTTP")
         finally:
             # Clean up
-            await client.stop_server("echo-stdio")
+            await client.stop_server(ECHO_STDIO)
             await client.stop_server("echo-http-server")
     
-    @pytest.mark.asyncio
     async def test_server_crash_and_restart(self, client):
         """Test ability to restart servers after crashes and reconnect."""
         # Start with the STDIO server
-        await client.launch_server("echo-stdio")
+        await client.launch_server(ECHO_STDIO)
         await asyncio.sleep(1)
         
         try:
             # First connection and query
-            stdio_client = await client.connect("echo-stdio")
-            response1 = await client.query_server("echo-stdio", "First message")
+            stdio_client = await client.connect(ECHO_STDIO)
+            response1 = await client.query_server(ECHO_STDIO, "First message")
             self._assert_response_matches(response1, "STDIO: First message")
             
             # Get the server PID
-            server_name = "echo-stdio"
+            server_name = ECHO_STDIO
             if server_name in client._local_processes:
                 process = client._local_processes[server_name]
                 pid = process.pid
@@ -270,12 +304,18 @@ class TestMultiTransportEcho:
                 
                 # Force kill the server (simulating a crash)
                 if os.name == "nt":  # Windows
-                    os.system(f"taskkill /F /PID {pid}")
+                    subprocess.run(
+                        ["taskkill", "/F", "/PID", str(pid)],
+                        check=False,
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
                 else:  # Unix/Linux/macOS
                     os.kill(pid, 9)  # SIGKILL
                 
-                # Give it time to die
-                await asyncio.sleep(2)
+                # Wait for the kernel to reap the process instead of sleeping a fixed time
+                await asyncio.wait_for(asyncio.to_thread(process.wait), timeout=3.0)
                 
                 # Verify it's no longer running
                 running, _ = client._is_server_running(server_name)
@@ -286,11 +326,11 @@ class TestMultiTransportEcho:
                 await asyncio.sleep(2)
                 
                 # Try connecting and querying again
-                stdio_client2 = await client.connect("echo-stdio")
-                response2 = await client.query_server("echo-stdio", "After restart")
+                stdio_client2 = await client.connect(ECHO_STDIO)
+                response2 = await client.query_server(ECHO_STDIO, "After restart")
                 self._assert_response_matches(response2, "STDIO: After restart")
             else:
                 pytest.skip("Could not find server process to kill")
         finally:
             # Clean up
-            await client.stop_server("echo-stdio")
\ No newline at end of file
+            await client.stop_server(ECHO_STDIO)
\ No newline at end of file
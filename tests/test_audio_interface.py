@@ -17,10 +17,10 @@ pytestmark = pytest.mark.asyncio
 
 
 @pytest.fixture
-async def client():
+async def client(client_config):
     """Create a client instance for testing, using the example config."""
     config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples", "config.json")
-    client = MultiServerClient(config_path=config_path)
+    client = MultiServerClient(config_path=config_path, custom_config=client_config)
     
     try:
         yield client
@@ -48,27 +48,35 @@ class TestAudioInterface:
         # Check if the args point to the audio server script
         assert any("audio_server.py" in arg for arg in server_config["args"]), "audio_server.py not in args"
     
-    @pytest.mark.xfail(reason="May fail if audio dependencies are not installed")
-    async def test_audio_interface_launch(self, client):
-        """Test launching the audio-interface server."""
+    async def test_audio_interface_launch_and_logs(self, client):
+        """Test launching the audio-interface server and getting its log paths.
+
+        Launch and log lookup share a single server launch, since starting the
+        subprocess is the expensive part of both checks.
+        """
         try:
-            # Attempt to launch the server
-            success = await client.launch_server("audio-interface")
-            
-            # The test may pass or fail depending on whether the dependencies are installed
+            # Attempt to launch the server (this may succeed or fail depending on dependencies)
+            try:
+                success = await client.launch_server("audio-interface")
+            except Exception:
+                success = False
+
+            # Even if the server fails to start, we should have stderr logs
+            log_info = client.get_server_logs("audio-interface")
+            assert "stderr" in log_info, "stderr key not in log_info"
+
             if success:
                 # If successful, verify it's running
                 is_running, _ = client._is_server_running("audio-interface")
                 assert is_running, "Server should be running after successful launch"
             else:
                 # If failed, check if we can access the logs
-                log_info = client.get_server_logs("audio-interface")
                 assert log_info["stderr"] is not None, "Expected stderr log to be created"
-                
+
                 # Print the error for debugging
                 print(f"Server launch failed as expected. Error logs are at: {log_info['stderr']}")
-                
-                # This will be marked as an expected failure
+
+                # Missing audio dependencies are an expected failure
                 pytest.xfail("Server launch failed due to missing dependencies")
         finally:
             # Try to stop the server if it's running
@@ -76,23 +84,3 @@ class TestAudioInterface:
                 await client.stop_server("audio-interface")
             except Exception:
                 pass
-    
-    async def test_get_server_logs(self, client):
-        """Test that we can get log paths for the audio-interface server."""
-        # Launch the server (this may succeed or fail depending on dependencies)
-        try:
-            await client.launch_server("audio-interface")
-        except Exception:
-            pass
-        
-        # Get logs
-        log_info = client.get_server_logs("audio-interface")
-        
-        # Even if the server fails to start, we should have stderr logs
-        assert "stderr" in log_info, "stderr key not in log_info"
-        
-        # Clean up
-        try:
-            await client.stop_server("audio-interface")
-        except Exception:
-            pass
\ No newline at end of file
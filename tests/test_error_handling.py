@@ -6,39 +6,70 @@ resources are still properly cleaned up, preventing orphaned processes.
 """
 
 import os
+import copy
 import time
 import pytest
+import pytest_asyncio
 import logging
 import asyncio
 import signal
-from pathlib import Path
 
 from mcp_client_multi_server.client import MultiServerClient
+from tests._helpers import await_exit, pid_exited
 
 
-# Setup logging
+# Setup logging; only attach a handler once, even if the module is imported again
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
-ch = logging.StreamHandler()
-ch.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-ch.setFormatter(formatter)
-logger.addHandler(ch)
+if not logger.handlers:
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    ch.setFormatter(formatter)
+    logger.addHandler(ch)
 
 
-# Path to the example config file
-CONFIG_PATH = Path(__file__).parent.parent / "examples" / "config.json"
+# Run every test in the module's event loop, which the module-scoped shared
+# client is created in
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
+# Name the echo server after the pytest-xdist worker running the tests. Launched
+# servers are recorded by name in a registry shared by every client on the
+# machine, so with a shared name one worker could mistake another worker's echo
+# server for its own.
+ECHO_SERVER = f"echo-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
 
-@pytest.fixture
-def config_path():
-    """Provide the path to the example config file."""
-    assert CONFIG_PATH.exists(), f"Example config not found at {CONFIG_PATH}"
-    return str(CONFIG_PATH)
+# Echo server for the tests that stop or kill their server, kept apart from the
+# one the shared client keeps running
+DEDICATED_ECHO_SERVER = f"{ECHO_SERVER}-dedicated"
 
 
-@pytest.fixture
-def process_tracker():
+def make_client(config_path, client_config, server_name: str = ECHO_SERVER) -> MultiServerClient:
+    """Create a client whose config has the example echo server under ``server_name``."""
+    client_config["mcpServers"][server_name] = client_config["mcpServers"]["echo"]
+    return MultiServerClient(config_path=config_path, custom_config=client_config, logger=logger)
+
+
+async def _await_pid_exit(pid: int, timeout: float = 2.0) -> bool:
+    """Wait until the process with the given PID has exited.
+
+    Args:
+        pid: PID of the process to wait for
+        timeout: Maximum number of seconds to wait
+
+    Returns:
+        True if the process exited, False if it was still running at the deadline
+    """
+    deadline = time.monotonic() + timeout
+    while not pid_exited(pid):
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.02)
+    return True
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def process_tracker():
     """
     Process tracker that doesn't rely on psutil.
     
@@ -50,53 +81,69 @@ def process_tracker():
     
     yield process_info
     
-    # Check if any tracked processes are still running
+    # Check if any tracked processes are still running, giving each a moment to exit
     for pid in process_info.get('started_processes', []):
+        if await _await_pid_exit(pid, timeout=0.5):
+            # Process is gone, which is good
+            continue
+        logger.error(f"Orphaned process found: PID={pid}")
+        # Try to terminate it
         try:
-            # Try sending signal 0 to check if process exists
-            os.kill(pid, 0)
-            # If we get here, process is still running
-            logger.error(f"Orphaned process found: PID={pid}")
-            # Try to terminate it
-            try:
-                os.kill(pid, signal.SIGTERM)
-                logger.info(f"Sent SIGTERM to orphaned process: {pid}")
-            except Exception as e:
-                logger.error(f"Failed to terminate orphaned process {pid}: {e}")
-        except OSError:
-            # Process not found, which is good
-            pass
-
-
-@pytest.fixture
-async def client(config_path):
-    """Create a MultiServerClient instance for testing."""
-    client = MultiServerClient(config_path=config_path, logger=logger)
+            os.kill(pid, signal.SIGTERM)
+            logger.info(f"Sent SIGTERM to orphaned process: {pid}")
+        except Exception as e:
+            logger.error(f"Failed to terminate orphaned process {pid}: {e}")
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(config_path, client_config):
+    """Create a MultiServerClient instance of its own for a test that stops its server."""
+    client = make_client(config_path, client_config, DEDICATED_ECHO_SERVER)
     yield client
     # Clean up after tests
     logger.info("Closing client and stopping all servers")
     await client.close()
-    
-    # Wait a moment to ensure all processes are cleaned up
-    await asyncio.sleep(0.5)
+    assert not client._local_processes, f"Servers left running after close: {list(client._local_processes)}"
 
 
-@pytest.mark.asyncio
-async def test_cleanup_after_error(client, process_tracker):
-    """Test that resources are properly cleaned up after an error occurs."""
-    # Launch the echo server
-    server_name = "echo"
-    launch_result = await client.launch_server(server_name)
-    assert launch_result, f"Failed to launch {server_name} server"
-    
-    # Store process info for cleanup verification
-    process = client._local_processes.get(server_name)
-    if process:
-        process_tracker['started_processes'].append(process.pid)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_client(config_path, raw_config):
+    """Create one client whose echo server is shared by the tests that leave it running.
+
+    Its teardown is the cleanup check for those tests: closing the client must
+    stop every server it launched.
+    """
+    client = make_client(config_path, copy.deepcopy(raw_config))
+    yield client
+    procs = client._local_processes
+    launched = list(procs.values())
+    logger.info("Closing shared client and stopping all servers")
+    await client.close()
+    assert not procs, f"Servers left running after close: {list(procs)}"
+    for process in launched:
+        assert await await_exit(process), f"Process {process.pid} is still running after close"
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def echo_server(shared_client):
+    """Make sure the shared client's echo server is running, launching it only the first time."""
+    launch_result = await shared_client.launch_server(ECHO_SERVER)
+    assert launch_result, f"Failed to launch {ECHO_SERVER} server"
     
-    # Verify server is running
-    assert server_name in client._local_processes, f"{server_name} process not in _local_processes after launch"
-    assert client._local_processes[server_name].poll() is None, f"{server_name} process not running after launch"
+    process = shared_client._local_processes.get(ECHO_SERVER)
+    assert process is not None, f"{ECHO_SERVER} process not in _local_processes after launch"
+    assert process.poll() is None, f"{ECHO_SERVER} process not running after launch"
+    return process
+
+
+async def test_cleanup_after_error(shared_client, echo_server):
+    """Test that an error leaves the client usable and its server running.
+
+    The shared_client fixture checks that the server is cleaned up when the
+    client is closed.
+    """
+    client = shared_client
+    server_name = ECHO_SERVER
     
     try:
         # Simulate an error during test
@@ -104,30 +151,26 @@ async def test_cleanup_after_error(client, process_tracker):
             server_name=server_name,
             tool_name="nonexistent_tool"  # This should trigger an error
         )
-        assert False, "Expected an error when calling nonexistent tool"
     except Exception as e:
         logger.info(f"Expected error occurred: {e}")
-        # This is expected - ensure process is still tracked for cleanup
-        pass
+    else:
+        assert response is None, "Expected no response when calling nonexistent tool"
     
-    # Now properly close the client and check cleanup
-    await client.close()
+    # The server should still be running and tracked for cleanup
+    assert echo_server.poll() is None, f"{server_name} process stopped after an error"
+    assert client._local_processes.get(server_name) is echo_server, f"{server_name} process no longer tracked after an error"
     
-    # Wait a moment to ensure all processes are terminated
-    await asyncio.sleep(1)
-    
-    # Verify server process is gone after cleanup
-    assert server_name not in client._local_processes, f"{server_name} process still in _local_processes after close"
-    
-    # Check if the process is still running
-    if process:
-        poll_result = process.poll()
-        assert poll_result is not None, f"Process for {server_name} is still running after close"
+    # And the client should still be able to talk to it
+    response = await client.query_server(
+        server_name=server_name,
+        tool_name="ping"
+    )
+    assert response is not None, "Expected response from server after an error"
 
 
-@pytest.mark.asyncio
-async def test_error_during_server_launch(client, process_tracker):
+async def test_error_during_server_launch(shared_client, echo_server):
     """Test handling of errors during server launch."""
+    client = shared_client
     # Try to launch a nonexistent server - test is successful if this fails cleanly
     server_name = "nonexistent-server"
     
@@ -138,56 +181,30 @@ async def test_error_during_server_launch(client, process_tracker):
     except Exception as e:
         assert False, f"launch_server should handle nonexistent servers gracefully but raised: {e}"
     
-    # Now launch a real server and verify cleanup still works
-    working_server = "echo"
-    launch_result = await client.launch_server(working_server)
-    assert launch_result, f"Failed to launch {working_server} server"
-    
-    # Store process info for cleanup verification
-    process = client._local_processes.get(working_server)
-    if process:
-        process_tracker['started_processes'].append(process.pid)
-    
-    # Close the client and check cleanup
-    await client.close()
-    
-    # Wait a moment to ensure all processes are terminated
-    await asyncio.sleep(1)
-    
-    # Verify server process is gone after cleanup
-    assert working_server not in client._local_processes, f"{working_server} process still in _local_processes after close"
-    
-    # Check if tracked processes are still running
-    for pid in process_tracker['started_processes']:
-        try:
-            # Try sending signal 0 to check if process exists
-            os.kill(pid, 0)
-            # If we get here, process is still running
-            assert False, f"Process {pid} for server is still running after close"
-        except OSError:
-            # Process not found, which is good
-            pass
+    # The failed launch must not disturb the server that is already running
+    working_server = ECHO_SERVER
+    assert echo_server.poll() is None, f"{working_server} process stopped after a failed launch"
+    assert client._local_processes.get(working_server) is echo_server, f"{working_server} process no longer tracked after a failed launch"
 
 
-@pytest.mark.asyncio
 async def test_query_with_stopped_server(client, process_tracker):
     """Test querying a server after it has been manually stopped."""
-    server_name = "echo"
+    server_name = DEDICATED_ECHO_SERVER
     
     # First launch and verify
     launch_result = await client.launch_server(server_name)
     assert launch_result, f"Failed to launch {server_name} server"
     
     # Store process info
-    process = client._local_processes.get(server_name)
+    procs = client._local_processes
+    process = procs.get(server_name)
     if process:
         process_tracker['started_processes'].append(process.pid)
     
-    # Stop the process manually
+    # Stop the process manually and make sure it has exited
     await client.stop_server(server_name)
-    
-    # Wait a moment to ensure process is terminated
-    await asyncio.sleep(0.5)
+    if process:
+        assert await await_exit(process), f"Process for {server_name} is still running after stop"
     
     # Now try to query the stopped server - this should handle the error gracefully
     try:
@@ -200,10 +217,9 @@ async def test_query_with_stopped_server(client, process_tracker):
         assert response is not None, "Expected response from auto-launched server"
         
         # Update the started processes list with newly launched process
-        if server_name in client._local_processes:
-            new_process = client._local_processes.get(server_name)
-            if new_process and new_process.pid:
-                process_tracker['started_processes'].append(new_process.pid)
+        new_process = procs.get(server_name)
+        if new_process and new_process.pid:
+            process_tracker['started_processes'].append(new_process.pid)
     except Exception as e:
         # If auto_launch is True, we should eventually get a response
         if client._auto_launch:
@@ -214,46 +230,37 @@ async def test_query_with_stopped_server(client, process_tracker):
     
     # Check if tracked processes are still running
     for pid in process_tracker['started_processes']:
-        try:
-            # Try sending signal 0 to check if process exists
-            os.kill(pid, 0)
-            # If we get here, process is still running
-            assert False, f"Process {pid} for server is still running after close"
-        except OSError:
-            # Process not found, which is good
-            pass
+        assert await _await_pid_exit(pid), f"Process {pid} for server is still running after close"
 
 
-@pytest.mark.asyncio
-async def test_cleanup_after_abnormal_termination(config_path, process_tracker):
+async def test_cleanup_after_abnormal_termination(config_path, client_config, process_tracker):
     """Test that resources are cleaned up even if server terminates abnormally."""
     # Create client
-    client = MultiServerClient(config_path=config_path, logger=logger)
+    client = make_client(config_path, client_config, DEDICATED_ECHO_SERVER)
     
     # Launch the echo server
-    server_name = "echo"
+    server_name = DEDICATED_ECHO_SERVER
     launch_result = await client.launch_server(server_name)
     assert launch_result, f"Failed to launch {server_name} server"
     
     # Store process info for cleanup verification
-    process = client._local_processes.get(server_name)
-    assert process is not None, "Process should exist after launch"
+    procs = client._local_processes
+    process = procs.get(server_name)
+    assert process is not None, f"{server_name} process not in _local_processes after launch"
     process_tracker['started_processes'].append(process.pid)
+    # The Popen objects this test launched, which are waited on at cleanup
+    processes = [process]
     
     # Verify server is running
-    assert server_name in client._local_processes, f"{server_name} process not in _local_processes after launch"
-    assert client._local_processes[server_name].poll() is None, f"{server_name} process not running after launch"
+    assert process.poll() is None, f"{server_name} process not running after launch"
     
     # Simulate the process exiting abnormally
     try:
         # Terminate the process directly
         process.terminate()
         
-        # Wait a moment for process to terminate
-        await asyncio.sleep(0.5)
-        
         # Verify process has stopped
-        assert process.poll() is not None, "Process should have terminated"
+        assert await await_exit(process), "Process should have terminated"
         
         # Now try to query the server - client should detect the process is gone
         result = await client.query_server(
@@ -264,9 +271,8 @@ async def test_cleanup_after_abnormal_termination(config_path, process_tracker):
         # If auto_launch is enabled, client will relaunch the process
         if client._auto_launch:
             # The server should exist in the client's local processes
-            assert server_name in client._local_processes, "Server should have been auto-launched"
-            new_process = client._local_processes.get(server_name)
-            assert new_process is not None, "New process should exist after auto-launch"
+            new_process = procs.get(server_name)
+            assert new_process is not None, "Server should have been auto-launched"
 
             # Note: In some implementations, the client may reuse the existing process object
             # but the actual OS process is a new one, so we can't reliably check PID differences
@@ -274,26 +280,22 @@ async def test_cleanup_after_abnormal_termination(config_path, process_tracker):
             # Add the new process to tracking if it's not already there
             if new_process.pid not in process_tracker['started_processes']:
                 process_tracker['started_processes'].append(new_process.pid)
+            if new_process is not process:
+                processes.append(new_process)
         else:
             # Without auto-launch, we should get an error
             assert result is None, "Expected None result when querying terminated server without auto-launch"
     finally:
-        # Clean up
-        await client.close()
-        
-        # Wait a moment to ensure all processes are terminated
-        await asyncio.sleep(1)
+        # Clean up, waiting for the processes to exit while close() runs. Wait on
+        # the Popen objects rather than reaping raw PIDs, so the returncode Popen
+        # reports stays accurate and close() never signals an already-reaped PID.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(client.close())
+            exits = [tg.create_task(await_exit(proc)) for proc in processes]
         
-        # Check if tracked processes are still running
-        for pid in process_tracker['started_processes']:
-            try:
-                # Try sending signal 0 to check if process exists
-                os.kill(pid, 0)
-                # If we get here, process is still running
-                assert False, f"Process {pid} for server is still running after close"
-            except OSError:
-                # Process not found, which is good
-                pass
+        # Check if the processes are still running
+        for proc, exited in zip(processes, exits):
+            assert exited.result(), f"Process {proc.pid} for server is still running after close"
 
 
 if __name__ == "__main__":
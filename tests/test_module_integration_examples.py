@@ -7,72 +7,114 @@ examples should be updated together.
 """
 
 import asyncio
+import copy
 import logging
 import pytest
+import pytest_asyncio
 import os
+import random
 import sys
-from unittest.mock import AsyncMock, MagicMock, patch
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 from mcp_client_multi_server import MultiServerClient
 
 
-@pytest.fixture
-def config_path():
-    """Fixture to provide the config path."""
-    path = Path("examples/config.json")
-    if not path.exists():
-        pytest.skip("Configuration file not found")
-    return path
+# Run every test in the module's event loop, which the module-scoped shared
+# client is created in
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
+# Echo server the shared client keeps running for the whole module. It is named
+# after the pytest-xdist worker, and kept apart from the "echo" server the
+# lifecycle examples launch and stop, because launched servers are recorded by
+# name in a registry shared by every client on the machine.
+SHARED_ECHO_SERVER = f"echo-shared-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
 
-class TestBasicUsageExample:
-    """Tests for the Basic Usage example from the README."""
+# Echo server the multiple-servers example launches next to the filesystem server.
+# That example is pinned to the "filesystem" worker group, so it can't also join
+# the "echo" group and uses its own per-worker name instead.
+MULTI_ECHO_SERVER = f"echo-multi-{os.environ.get('PYTEST_XDIST_WORKER', 'main')}"
 
-    @pytest.mark.asyncio
-    async def test_basic_usage(self, config_path):
-        """Test the basic usage example."""
-        # Create client with specific config path (instead of default locations)
-        client = MultiServerClient(config_path=config_path)
+# Home directory, which the example config allows the filesystem server to access
+HOME = str(Path.home())
 
-        try:
-            # Get a list of configured servers
-            servers = client.list_servers()
-            assert len(servers) > 0, "No servers found in configuration"
-            
-            # Echo server should be in the examples config
-            assert "echo" in servers, "Echo server not found in configuration"
+# Content of the file the multiple-servers example reads and echoes: exactly the
+# 50 characters the example previews, so no more than that crosses the pipes
+PREVIEW_TEXT = "Preview text for the multiple-servers example....."
 
-            # Connect to the echo server (will auto-launch if needed)
-            echo_client = await client.connect("echo")
-            assert echo_client is not None, "Failed to connect to echo server"
 
-            # Query the echo server with a message
-            test_message = "Hello, world from test!"
-            response = await client.query_server(
-                server_name="echo",
-                message=test_message
-            )
-            
-            # The echo server should return our message
-            assert response is not None, "Failed to get response from echo server"
-            # The echo server appears to return a list with TextContent objects
-            if isinstance(response, list) and hasattr(response[0], 'text'):
-                # Extract text from the TextContent object
-                response_text = response[0].text
-            else:
-                response_text = str(response)
-            assert test_message in response_text, f"Echo response doesn't contain original message"
+@pytest.fixture(scope="session")
+def preview_file():
+    """Write a small file with known content for the filesystem server to read.
 
-        finally:
-            # Close client, stopping STDIO servers
-            await client.close()
+    The file goes in the home directory, is written once per session (so once
+    per pytest-xdist worker, each with its own unique name), and is removed at
+    the end of the session.
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", dir=HOME, prefix=".pytest-preview-", suffix=".txt", delete=False
+    ) as f:
+        f.write(PREVIEW_TEXT)
+    yield f.name
+    os.unlink(f.name)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_client(config_path, raw_config):
+    """Create one client, with its echo server launched, for the examples that only query it."""
+    config = copy.deepcopy(raw_config)
+    config["mcpServers"][SHARED_ECHO_SERVER] = config["mcpServers"]["echo"]
+    client = MultiServerClient(config_path=config_path, custom_config=config)
+    success = await client.launch_server(SHARED_ECHO_SERVER)
+    assert success, f"Failed to launch {SHARED_ECHO_SERVER} server"
+    yield client
+    # Close client, stopping STDIO servers
+    await client.close(stop_servers=True)
+
+
+class TestBasicUsageExample:
+    """Tests for the Basic Usage example from the README."""
 
+    async def test_basic_usage(self, shared_client):
+        """Test the basic usage example."""
+        # The shared client was created with the example config and has its
+        # echo server running already
+        client = shared_client
 
+        # Get a list of configured servers
+        servers = client.list_servers()
+        assert len(servers) > 0, "No servers found in configuration"
+        
+        # Echo server should be in the examples config
+        assert "echo" in servers, "Echo server not found in configuration"
+
+        # Connect to the echo server (will auto-launch if needed)
+        echo_client = await client.connect(SHARED_ECHO_SERVER)
+        assert echo_client is not None, "Failed to connect to echo server"
+
+        # Query the echo server with a message
+        test_message = "Hello, world from test!"
+        response = await client.query_server(
+            server_name=SHARED_ECHO_SERVER,
+            message=test_message
+        )
+        
+        # The echo server should return our message
+        assert response is not None, "Failed to get response from echo server"
+        # The echo server appears to return a list with TextContent objects
+        if isinstance(response, list) and hasattr(response[0], 'text'):
+            # Extract text from the TextContent object
+            response_text = response[0].text
+        else:
+            response_text = str(response)
+        assert test_message in response_text, f"Echo response doesn't contain original message"
+
+
+@pytest.mark.xdist_group("echo")  # Launches and stops the "echo" server by name
 class TestAdvancedUsageExample:
     """Tests for the Advanced Usage with Custom Lifecycle Management example."""
 
-    @pytest.mark.asyncio
     async def test_advanced_usage(self, config_path):
         """Test the advanced usage example with custom lifecycle management."""
         # Set up logging
@@ -116,14 +158,22 @@ class TestAdvancedUsageExample:
             assert "process_message" in tool_names, "process_message tool not found"
             assert "ping" in tool_names, "ping tool not found"
 
-            # Execute multiple operations
-            for i in range(2):
+            # Execute multiple operations, holding one session open so they
+            # can be in flight at the same time
+            echo_client = await client.connect(echo_server)
+            assert echo_client is not None, f"Failed to connect to {echo_server} server"
+            async with echo_client:
+                responses = await asyncio.gather(*[
+                    client.query_server(
+                        server_name=echo_server,
+                        message=f"Message {i}",
+                        tool_name="process_message"
+                    )
+                    for i in range(2)
+                ])
+
+            for i, response in enumerate(responses):
                 test_message = f"Message {i}"
-                response = await client.query_server(
-                    server_name=echo_server,
-                    message=test_message,
-                    tool_name="process_message"
-                )
                 assert response is not None, f"Failed to get response for message {i}"
 
                 # Extract text from the response
@@ -165,29 +215,32 @@ class TestAdvancedUsageExample:
             assert success, f"Failed to stop {echo_server} server during cleanup"
 
 
+@pytest.mark.xdist_group("filesystem")
 class TestMultipleServersExample:
     """Tests for the Working with Multiple Servers example."""
 
-    @pytest.mark.asyncio
-    async def test_multiple_servers(self, config_path):
+    async def test_multiple_servers(self, config_path, client_config, preview_file):
         """Test working with multiple servers example."""
         # This test needs both echo and filesystem servers
-        client = MultiServerClient(config_path=config_path)
+        servers = client_config["mcpServers"]
+        
+        # Check if both servers are in config
+        if "echo" not in servers or "filesystem" not in servers:
+            pytest.skip("Test requires both echo and filesystem servers in config")
+
+        servers[MULTI_ECHO_SERVER] = servers["echo"]
+        client = MultiServerClient(config_path=config_path, custom_config=client_config)
         
         try:
-            servers = client.list_servers()
-            
-            # Check if both servers are in config
-            if "echo" not in servers or "filesystem" not in servers:
-                pytest.skip("Test requires both echo and filesystem servers in config")
-                
             # Launch servers
             await client.launch_server("filesystem")
-            await client.launch_server("echo")
+            await client.launch_server(MULTI_ECHO_SERVER)
             
             # For specialized operations, work directly with multiple servers
-            filesystem_tools = await client.list_server_tools("filesystem")
-            echo_tools = await client.list_server_tools("echo")
+            filesystem_tools, echo_tools = await asyncio.gather(
+                client.list_server_tools("filesystem"),
+                client.list_server_tools(MULTI_ECHO_SERVER),
+            )
             
             assert filesystem_tools is not None, "Failed to list filesystem tools"
             assert echo_tools is not None, "Failed to list echo tools"
@@ -201,7 +254,7 @@ class TestMultipleServersExample:
             assert "process_message" in echo_tool_names, "process_message tool not found"
             
             # Find a valid directory to list (use home directory)
-            home_dir = str(Path.home())
+            home_dir = HOME
             
             # List files in directory
             file_list = await client.query_server(
@@ -217,19 +270,8 @@ class TestMultipleServersExample:
             if not file_list:
                 pytest.skip(f"No files found in {home_dir}, can't continue test")
                 
-            # Find a readable text file for the test
-            # We'll look for a common dotfile like .bashrc or .profile
-            test_file = None
-            for dotfile in [".bashrc", ".profile", ".bash_profile", ".zshrc"]:
-                filepath = os.path.join(home_dir, dotfile)
-                if os.path.isfile(filepath) and os.access(filepath, os.R_OK):
-                    test_file = filepath
-                    break
-                    
-            if not test_file:
-                pytest.skip("No suitable test file found in home directory")
-            
-            # Read the test file
+            # Read the test file, which holds just the text to preview
+            test_file = preview_file
             file_content = await client.query_server(
                 server_name="filesystem",
                 tool_name="read_file",
@@ -248,10 +290,11 @@ class TestMultipleServersExample:
                 file_text = str(file_content)
                 assert len(file_text) > 0, "File content should not be empty"
             
-            # Process the first few characters with echo server
-            preview = file_text[:50] if len(file_text) > 50 else file_text
+            # Process the preview with echo server
+            assert file_text == PREVIEW_TEXT, "File content doesn't match what was written"
+            preview = file_text
             processed = await client.query_server(
-                server_name="echo",
+                server_name=MULTI_ECHO_SERVER,
                 message=preview
             )
 
@@ -270,42 +313,34 @@ class TestMultipleServersExample:
             await client.close(stop_servers=True)
 
 
+@pytest.mark.xdist_group("echo")  # Launches and stops the "echo" server by name
 class TestWebApplicationExample:
     """Tests for the Integration with Web Applications example."""
 
-    @pytest.mark.asyncio
     async def test_web_application_integration(self, config_path):
         """Test the web application integration example from the README."""
-        # We'll create a mock FastAPI app and test the handlers
-
-        # Create a mock FastAPI app
-        mock_app = MagicMock()
-        mock_app.on_event = MagicMock()
-        mock_app.get = MagicMock()
-        mock_app.post = MagicMock()
-
-        # Create mock request handlers dictionary to store the handlers
-        event_handlers = {}
-        route_handlers = {}
-
-        # Mock implementation of app.on_event
-        def on_event_impl(event_name):
-            def decorator(func):
-                event_handlers[event_name] = func
-                return func
-            return decorator
-
-        # Mock implementation of route decorators
-        def route_decorator_impl(path):
-            def decorator(func):
-                route_handlers[path] = func
-                return func
-            return decorator
-
-        # Set up our mocks
-        mock_app.on_event.side_effect = on_event_impl
-        mock_app.get.side_effect = route_decorator_impl
-        mock_app.post.side_effect = route_decorator_impl
+        # We'll create a fake FastAPI app and test the handlers
+
+        # Fake FastAPI app that just records the handlers its decorators register
+        class FakeApp:
+            def __init__(self):
+                self.events = {}
+                self.routes = {}
+                self.state = SimpleNamespace()
+
+            def on_event(self, event_name):
+                def decorator(func):
+                    self.events[event_name] = func
+                    return func
+                return decorator
+
+            def get(self, path):
+                def decorator(func):
+                    self.routes[path] = func
+                    return func
+                return decorator
+
+            post = get
 
         # Mock for BackgroundTasks
         class MockBackgroundTasks:
@@ -316,7 +351,7 @@ class TestWebApplicationExample:
                 self.tasks.append((func, args, kwargs))
 
         # Now implement the FastAPI app from the README
-        app = mock_app
+        app = FakeApp()
         client = None
 
         @app.on_event("startup")
@@ -324,6 +359,8 @@ class TestWebApplicationExample:
             """Initialize the MCP client when the app starts."""
             nonlocal client
             client = MultiServerClient(config_path=config_path)
+            # The configured servers don't change while the app runs, so list them once
+            app.state.servers = client.list_servers()
 
             # Launch any critical servers at startup
             await client.launch_server("echo")
@@ -358,10 +395,9 @@ class TestWebApplicationExample:
         @app.get("/status")
         async def get_status():
             """Get status of all configured servers."""
-            servers = client.list_servers()
             result = {}
 
-            for server in servers:
+            for server in app.state.servers:
                 is_running, pid = client._is_server_running(server)
                 result[server] = {
                     "running": is_running,
@@ -379,7 +415,7 @@ class TestWebApplicationExample:
         # Test the handlers
 
         # Test startup handler
-        startup_result = await event_handlers["startup"]()
+        startup_result = await app.events["startup"]()
         assert startup_result == "MCP servers initialized and ready"
 
         # Verify client was initialized
@@ -387,35 +423,35 @@ class TestWebApplicationExample:
 
         # Test query endpoint
         test_message = "Test message for web app"
-        query_result = await route_handlers["/query/{server}"]("echo", test_message)
+        query_result = await app.routes["/query/{server}"]("echo", test_message)
         assert "result" in query_result
         assert query_result["result"] is not None
 
         # Test launch endpoint with background tasks
         bg_tasks = MockBackgroundTasks()
-        launch_result = await route_handlers["/launch/{server}"]("echo", bg_tasks)
+        launch_result = await app.routes["/launch/{server}"]("echo", bg_tasks)
         assert "status" in launch_result
         assert "launch initiated" in launch_result["status"]
         assert len(bg_tasks.tasks) == 1  # One task should be added
 
         # Test status endpoint
-        status_result = await route_handlers["/status"]()
+        status_result = await app.routes["/status"]()
         assert "echo" in status_result
         assert "running" in status_result["echo"]
 
         # Test stop endpoint
-        stop_result = await route_handlers["/stop/{server}"]("echo")
+        stop_result = await app.routes["/stop/{server}"]("echo")
         assert "status" in stop_result
 
         # Finally test the shutdown handler
-        shutdown_result = await event_handlers["shutdown"]()
+        shutdown_result = await app.events["shutdown"]()
         assert shutdown_result == "MCP client connections closed"
 
 
+@pytest.mark.xdist_group("echo")  # Auto-launches the "echo" server by name
 class TestErrorHandlingExample:
     """Tests for the Error Handling and Reconnection example."""
 
-    @pytest.mark.asyncio
     async def test_error_handling_wrapper(self, config_path):
         """Test the error handling wrapper class from the example."""
         # Implementation of the MCPApplicationClient from the README
@@ -426,6 +462,7 @@ class TestErrorHandlingExample:
                 self.config_path = config_path
                 self.client = None
                 self.initialized = False
+                self.logger = logging.getLogger(__name__)
 
             async def initialize(self):
                 """Initialize the MCP client with error handling."""
@@ -434,7 +471,7 @@ class TestErrorHandlingExample:
                         self.client = MultiServerClient(config_path=self.config_path)
                         self.initialized = True
                     except Exception as e:
-                        print(f"Error initializing MCP client: {e}")
+                        self.logger.error(f"Error initializing MCP client: {e}")
                         raise
                 return self.client
 
@@ -456,7 +493,7 @@ class TestErrorHandlingExample:
                         return response
                     except Exception as e:
                         retries += 1
-                        print(f"Error querying server {server_name} (attempt {retries}/{max_retries}): {e}")
+                        self.logger.warning(f"Error querying server {server_name} (attempt {retries}/{max_retries}): {e}")
 
                         if retries >= max_retries:
                             raise
@@ -464,11 +501,11 @@ class TestErrorHandlingExample:
                         # Check if server is running, restart if needed
                         is_running, _ = self.client._is_server_running(server_name)
                         if not is_running:
-                            print(f"Server {server_name} not running, attempting to relaunch...")
+                            self.logger.warning(f"Server {server_name} not running, attempting to relaunch...")
                             await self.client.launch_server(server_name)
 
-                        # Wait before retrying
-                        await asyncio.sleep(retry_delay)
+                        # Wait before retrying, backing off exponentially with jitter
+                        await asyncio.sleep(retry_delay * (2 ** (retries - 1)) + random.uniform(0, retry_delay))
 
                 # This should not be reached due to the raise in the loop
                 raise Exception(f"Failed to query server {server_name} after {max_retries} attempts")
@@ -4,35 +4,62 @@ Tests specifically for NPX-based MCP servers.
 
 import logging
 import pytest
+import pytest_asyncio
 import asyncio
-from pathlib import Path
+import shutil
 
 from mcp_client_multi_server.client import MultiServerClient
 
-# Path to the example config file
-EXAMPLE_CONFIG_PATH = Path(__file__).parent.parent / "examples" / "config.json"
-
 # Configure logging
 logger = logging.getLogger("npx_tests")
 logger.setLevel(logging.DEBUG)
 
 
-@pytest.fixture
-def config_path():
-    """Provide the path to the example config file."""
-    assert EXAMPLE_CONFIG_PATH.exists(), f"Example config not found at {EXAMPLE_CONFIG_PATH}"
-    return str(EXAMPLE_CONFIG_PATH)
+# Run every test in the session's event loop, which the shared filesystem client is
+# created in, and keep the tests on the same pytest-xdist worker as the other tests
+# that launch the "filesystem" server
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group("filesystem"),
+]
+
+
+async def _run_probe(*command, timeout=5):
+    """
+    Run a probe command without blocking the event loop.
+
+    Args:
+        command: The program and its arguments
+        timeout: Seconds to wait before killing the command
+
+    Returns:
+        Tuple of (return code, stdout, stderr)
+
+    Raises:
+        asyncio.TimeoutError: If the command doesn't finish within the timeout
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
 
 
-@pytest.fixture
-def require_npx_filesystem():
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def require_npx_filesystem():
     """
     Check if the NPX filesystem package is available.
     Skip tests if it's not available.
-    """
-    import subprocess
-    import shutil
 
+    The probes spawn npx and npm, so they run once per session, concurrently.
+    """
     # Find npx executable
     npx_path = shutil.which("npx")
     if not npx_path:
@@ -40,108 +67,132 @@ def require_npx_filesystem():
 
     # Check if the filesystem package is available
     try:
-        # Run a simple check command that doesn't actually run the server
-        result = subprocess.run(
-            [npx_path, "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        # If exit code is not 0, npx itself might be broken
-        if result.returncode != 0:
-            pytest.skip(f"npx command not working: {result.stderr}")
-
-        # Now specifically check the filesystem package
-        # We can check if it's installed globally first
-        result = subprocess.run(
-            ["npm", "list", "-g", "@modelcontextprotocol/server-filesystem"],
-            capture_output=True,
-            text=True,
-            timeout=5
+        # Run a simple check command that doesn't actually run the server, and
+        # check if the filesystem package is installed globally at the same time
+        (npx_code, _, npx_stderr), (_, npm_stdout, _) = await asyncio.gather(
+            _run_probe(npx_path, "--version"),
+            _run_probe("npm", "list", "-g", "@modelcontextprotocol/server-filesystem"),
         )
+    except (OSError, asyncio.TimeoutError) as e:
+        pytest.skip(f"Error checking for NPX or filesystem package: {e!r}")
 
-        # If not globally installed, we'll fall back to npx's on-demand behavior
-        if "empty" in result.stdout or "@modelcontextprotocol/server-filesystem" not in result.stdout:
-            # The package is not globally installed, but we can still try with npx directly
-            logger.info("Filesystem package not found in global npm packages, will try on-demand with npx")
-    except (subprocess.SubprocessError, subprocess.TimeoutExpired) as e:
-        pytest.skip(f"Error checking for NPX or filesystem package: {e}")
+    # If exit code is not 0, npx itself might be broken
+    if npx_code != 0:
+        pytest.skip(f"npx command not working: {npx_stderr}")
+
+    # If not globally installed, we'll fall back to npx's on-demand behavior
+    if "empty" in npm_stdout or "@modelcontextprotocol/server-filesystem" not in npm_stdout:
+        # The package is not globally installed, but we can still try with npx directly
+        logger.info("Filesystem package not found in global npm packages, will try on-demand with npx")
 
     # If we get here, either the package is installed or we'll let npx try to install it on-demand
     return npx_path
 
 
-@pytest.fixture
-async def client(config_path):
-    """Create a MultiServerClient instance for testing."""
+async def _wait_ready(client, server_name, attempts=3, timeout=20.0):
+    """
+    Wait until a launched server is running and answers a tool listing.
+
+    For a STDIO server each tool listing opens its own session, which starts
+    another server process, so the listing is only retried a few times with
+    backoff. The launched process is checked before every attempt.
+
+    Args:
+        client: The MultiServerClient that launched the server
+        server_name: Name of the server to wait for
+        attempts: Number of tool listings to try
+        timeout: Seconds to wait for each tool listing
+
+    Returns:
+        The server's tools; the test fails with the last error if the server
+        exits or never lists any tools
+    """
+    process = client._local_processes[server_name]
+    delay = 0.05
+    last_error = None
+    for attempt in range(1, attempts + 1):
+        if process.poll() is not None:
+            pytest.fail(f"{server_name} server exited with code {process.returncode} before it was ready")
+
+        try:
+            tools = await asyncio.wait_for(client.list_server_tools(server_name), timeout)
+        except asyncio.TimeoutError:
+            last_error = f"tool listing took longer than {timeout}s"
+        else:
+            if tools:
+                return tools
+            # list_server_tools() logs the underlying error and returns None
+            last_error = "tool listing failed, see the client log"
+
+        logger.info(f"{server_name} server not ready (attempt {attempt}/{attempts}): {last_error}")
+        if attempt < attempts:
+            await asyncio.sleep(delay)
+            delay *= 2
+
+    pytest.fail(f"{server_name} server not ready after {attempts} attempts: {last_error}")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def filesystem_client(config_path, require_npx_filesystem):
+    """Create a client and launch the filesystem server once for every NPX test."""
+    logger.info("Creating shared filesystem client")
     client = MultiServerClient(config_path=config_path, logger=logger)
+
+    # Launch server directly
+    logger.info("Attempting to launch filesystem server")
+    launch_result = await client.launch_server("filesystem")
+    assert launch_result is True, "Failed to launch filesystem server"
+
+    # Wait for the server to initialize, stopping it if it never does
+    try:
+        await _wait_ready(client, "filesystem")
+    except BaseException:
+        await client.close()
+        raise
+    assert client._local_processes["filesystem"].poll() is None, "Server process not running"
+
     yield client
-    # Clean up after tests
+
+    # Always clean up
+    logger.info("Cleaning up client")
     await client.close()
 
 
-@pytest.mark.asyncio
-async def test_filesystem_server_launch(require_npx_filesystem):
+async def test_filesystem_server_launch(filesystem_client):
     """Test launching the filesystem server directly."""
-    logger.info("Creating client for launch test")
-    client = MultiServerClient(config_path=str(EXAMPLE_CONFIG_PATH), logger=logger)
+    client = filesystem_client
 
-    try:
-        # Launch server directly
-        logger.info("Attempting to launch filesystem server")
-        launch_result = await client.launch_server("filesystem")
-
-        # Verify launch
-        assert launch_result is True, "Failed to launch filesystem server"
-        assert "filesystem" in client._local_processes, "Server process not found"
-        assert client._local_processes["filesystem"].poll() is None, "Server process not running"
-
-        # Wait a moment to let server initialize
-        await asyncio.sleep(1)
-
-        # Verify server is running by checking its PID
-        pid = client._local_processes["filesystem"].pid
-        assert pid > 0, "Invalid process ID"
-        logger.info(f"Filesystem server running with PID: {pid}")
-
-    finally:
-        # Always clean up
-        logger.info("Cleaning up client")
-        await client.close()
+    # Verify launch
+    assert "filesystem" in client._local_processes, "Server process not found"
+    assert client._local_processes["filesystem"].poll() is None, "Server process not running"
 
+    # Verify server is running by checking its PID
+    pid = client._local_processes["filesystem"].pid
+    assert pid > 0, "Invalid process ID"
+    logger.info(f"Filesystem server running with PID: {pid}")
 
-@pytest.mark.asyncio
-async def test_filesystem_server_tools(require_npx_filesystem):
+
+async def test_filesystem_server_tools(filesystem_client):
     """Test listing tools from the filesystem server."""
-    logger.info("Creating client for tools test")
-    client = MultiServerClient(config_path=str(EXAMPLE_CONFIG_PATH), logger=logger)
+    client = filesystem_client
 
-    try:
-        # Launch and connect
-        await client.launch_server("filesystem")
-
-        # List tools directly
-        logger.info("Listing tools from filesystem server")
-        tools = await client.list_server_tools("filesystem")
-
-        # Verify tools
-        assert tools is not None, "No tools returned"
-        assert len(tools) > 0, "Empty tools list returned"
-
-        # Check for expected tools
-        tool_names = [tool["name"] for tool in tools]
-        logger.info(f"Found tools: {tool_names}")
-
-        # Filesystem server should have specific tools
-        expected_tools = ["list_directory", "read_file", "write_file", "list_allowed_directories"]
-        for expected_tool in expected_tools:
-            assert any(expected_tool in name for name in tool_names), \
-                   f"Expected tool not found: {expected_tool}"
-
-    finally:
-        # Clean up
-        logger.info("Cleaning up client")
-        await client.close()
+    # List tools directly
+    logger.info("Listing tools from filesystem server")
+    tools = await client.list_server_tools("filesystem")
+
+    # Verify tools
+    assert tools is not None, "No tools returned"
+    assert len(tools) > 0, "Empty tools list returned"
+
+    # Check for expected tools
+    tool_names = [tool["name"] for tool in tools]
+    logger.info(f"Found tools: {tool_names}")
+
+    # Filesystem server should have specific tools
+    expected_tools = ["list_directory", "read_file", "write_file", "list_allowed_directories"]
+    for expected_tool in expected_tools:
+        assert any(expected_tool in name for name in tool_names), \
+               f"Expected tool not found: {expected_tool}"
 
 
 if __name__ == "__main__":
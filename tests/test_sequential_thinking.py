@@ -7,11 +7,9 @@ and basic operations work as expected.
 
 import os
 import pytest
-import asyncio
-import json
-from typing import Dict, Any
 
 from mcp_client_multi_server import MultiServerClient
+from tests._helpers import extract_text_content
 
 pytestmark = pytest.mark.asyncio
 
@@ -29,26 +27,6 @@ async def client():
         await client.close(stop_servers=True)
 
 
-def extract_text_content(response: Any) -> str:
-    """Extract text from TextContent objects or convert response to string."""
-    # Handle None case
-    if response is None:
-        return "None"
-    
-    # Handle list of TextContent objects
-    if hasattr(response, '__iter__') and not isinstance(response, (str, dict)) and hasattr(response, '__len__'):
-        if len(response) > 0 and all(hasattr(item, 'text') for item in response):
-            return response[0].text
-    # Handle single TextContent object
-    elif hasattr(response, 'text'):
-        return response.text
-    # Handle dictionary with text field
-    elif isinstance(response, dict) and 'text' in response:
-        return response['text']
-    # Default to string conversion
-    return str(response)
-
-
 class TestSequentialThinking:
     """Tests for the sequential-thinking server."""
     
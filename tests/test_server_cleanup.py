@@ -16,7 +16,6 @@ import logging
 import asyncio
 import subprocess
 import signal
-from pathlib import Path
 
 from mcp_client_multi_server.client import MultiServerClient
 
@@ -31,17 +30,6 @@ ch.setFormatter(formatter)
 logger.addHandler(ch)
 
 
-# Path to the example config file
-CONFIG_PATH = Path(__file__).parent.parent / "examples" / "config.json"
-
-
-@pytest.fixture
-def config_path():
-    """Provide the path to the example config file."""
-    assert CONFIG_PATH.exists(), f"Example config not found at {CONFIG_PATH}"
-    return str(CONFIG_PATH)
-
-
 @pytest.fixture
 def process_tracker():
     """
@@ -30,15 +30,6 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("test_server_lifecycle")
 
 
-@pytest.fixture
-def config_path():
-    """Fixture to provide the config path."""
-    path = Path("examples/config.json")
-    if not path.exists():
-        pytest.skip("Configuration file not found")
-    return path
-
-
 @pytest.fixture
 async def client(config_path):
     """Fixture to provide a client instance."""
@@ -9,22 +9,10 @@ import os
 import json
 import pytest
 import asyncio
-from pathlib import Path
 
 from mcp_client_multi_server.client import MultiServerClient
 
 
-# Path to the example config file
-EXAMPLE_CONFIG_PATH = Path(__file__).parent.parent / "examples" / "config.json"
-
-
-@pytest.fixture
-def config_path():
-    """Provide the path to the example config file."""
-    assert EXAMPLE_CONFIG_PATH.exists(), f"Example config not found at {EXAMPLE_CONFIG_PATH}"
-    return str(EXAMPLE_CONFIG_PATH)
-
-
 @pytest.fixture
 def require_npx_filesystem():
     """